@@ -1,19 +1,47 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from lakota import Repo, Schema
-from numpy import sin, cos, arange, around
+from numpy import add, sin, cos, arange, around, divide, empty
 from rich.progress import track
 
 repo = Repo('.lakota')
 schema = Schema(timestamp='timestamp*', value='float')
 clc = repo.create_collection(schema, 'trigo', raise_if_exists=False)
 
+N = 1_000_000
+WORKERS = min(8, os.cpu_count() or 1)
+# Buffers are re-used between steps (write does not keep a reference
+# to the arrays), one set per step in flight
+steps = arange(N)
+buffers = [
+    tuple(empty(N, dtype=dt) for dt in ('i8', 'f8', 'f8', 'f8'))
+    for _ in range(WORKERS)
+]
+pending = deque()
 
-with clc.multi():
-    for name, fn in [('sin', sin), ('cos', cos)]:
-        desc = f'Populate "{name}"'
-        for i in track(range(0, 1_000_000_000, 1_000_000), desc):
-            ts = arange(i, i + 1_000_000)
+with clc.multi(), ThreadPoolExecutor(WORKERS) as executor:
+    for pos, i in enumerate(
+            track(range(0, 1_000_000_000, N), 'Populate "sin" and "cos"')):
+        # Wait for the writes using the buffers we are about to fill
+        if len(pending) == WORKERS:
+            for fut in pending.popleft():
+                fut.result()
+        ts, x, *outs = buffers[pos % WORKERS]
+        add(steps, i, out=ts)
+        divide(ts, 50_000, out=x)
+        futures = []
+        for (name, fn), out in zip([('sin', sin), ('cos', cos)], outs):
+            fn(x, out=out)
+            around(out, 6, out=out)
             srs = clc / name
-            srs.write({
+            futures.append(executor.submit(srs.write, {
                 'timestamp': ts,
-                'value': around(fn(ts/50_000), 6),
-            })
+                'value': out,
+            }))
+        pending.append(futures)
+
+    for futures in pending:
+        for fut in futures:
+            fut.result()
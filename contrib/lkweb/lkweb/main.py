@@ -1,10 +1,12 @@
 import os
+from time import monotonic
 from uuid import uuid4
+import msgpack
 import orjson
 from urllib.parse import unquote
 from pathlib import Path
 
-from fastapi import FastAPI, Request, Query, Response
+from fastapi import FastAPI, HTTPException, Request, Query, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse
@@ -12,7 +14,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 
 from lakota import Repo
 from lakota.utils import logger
-from numpy import asarray, char
+from numpy import ascontiguousarray, asarray, char, ones
 from numpy.core.defchararray import find
 
 
@@ -20,6 +22,7 @@ lk_repo_url = os.environ.get("LAKOTA_REPO", ".lakota")
 logger.setLevel("CRITICAL")
 static_prefix = "static"
 PAGE_LEN = 500_000
+LS_TTL = 5  # Seconds during which listings are reused by /search
 LRU_SIZE = 500 * 1024 * 1024 # 500MB
 repo = Repo([
     f"memory://?lru_size={LRU_SIZE}",
@@ -28,8 +31,18 @@ repo = Repo([
 here = Path(__file__).resolve().parent
 
 
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+if os.environ.get("LK_DEBUG_JSON"):
+    ORJSON_OPTIONS |= orjson.OPT_INDENT_2
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content):
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
 title = "LK-web"
-app = FastAPI(app_name=title)
+app = FastAPI(app_name=title, default_response_class=ORJSONResponse)
 templates = Jinja2Templates(directory=here / "template")
 app.mount("/static", StaticFiles(directory=here / "static"), name="static")
 app.add_middleware(GZipMiddleware, minimum_size=100_000)
@@ -58,13 +71,6 @@ uplot_options = {
 }
 
 
-class ORJSONResponse(JSONResponse):
-    def render(self, content):
-        return orjson.dumps(
-            content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
-        )
-
-
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     # logo = (static_path / 'jensen-sm.png').open('rb').read()
@@ -85,16 +91,47 @@ async def favico():
     return ""  # TODO
 
 
+ls_cache = {}
+
+
+def cached_ls(key, fn):
+    """
+    Return `fn()`, reusing the value computed for `key` if it is less
+    than LS_TTL seconds old
+    """
+    now = monotonic()
+    hit = ls_cache.get(key)
+    if hit is not None and now - hit[0] < LS_TTL:
+        return hit[1]
+    value = fn()
+    ls_cache[key] = (now, value)
+    return value
+
+
+def ls_labels(name):
+    labels = asarray((repo / name).ls(), dtype="U")
+    return labels, char.lower(labels)
+
+
+def match_labels(labels, lower_labels, patterns):
+    """
+    Return the labels that contain every (lower-cased) pattern
+    """
+    cond = ones(len(labels), dtype=bool)
+    for pattern in patterns:
+        cond &= find(lower_labels, pattern) != -1
+    return labels[cond]
+
+
 @app.get("/search")
 def search(request: Request, label: str = ""):
-    patterns = label.split()
+    patterns = [p.lower() for p in label.split()]
     all_labels = []
-    for name in repo.ls():
-        clct = repo / name
-        labels = asarray(clct.ls(), dtype="U")
-        for pattern in patterns:
-            cond = find(char.lower(labels), pattern.lower()) != -1
-            all_labels.extend((name, l) for l in labels[cond])
+    if patterns:
+        for name in cached_ls(None, repo.ls):
+            labels, lower_labels = cached_ls(name, lambda: ls_labels(name))
+            matches = match_labels(labels, lower_labels, patterns)
+            all_labels.extend((name, l) for l in matches)
 
     return templates.TemplateResponse(
         "search-modal.html",
@@ -183,7 +220,6 @@ def view(
 @app.get("/read/{collection}/{label}/{column}.{ext}")
 def read(
     request: Request,
-    response: Response,
     collection: str,
     label: str,
     column: str,
@@ -226,19 +262,40 @@ def read(
                 "frame": frm,
         })
     else:
-        # Aggregate on time dimension
+        # Aggregate on time dimension (timestamps are exposed as
+        # integers, view avoids a copy)
         if len(series.schema.idx) > 1:
             dt = frm[column].dtype
             agg_col = f"(last self.{column})"
             frm = frm.reduce(tdim, agg_col)
-            data = [frm[tdim].astype(int), frm[agg_col].astype(dt)]
+            data = [frm[tdim].view("i8"), frm[agg_col].astype(dt, copy=False)]
         else:
-            data = [frm[tdim].astype(int), frm[column]]
+            data = [frm[tdim].view("i8"), frm[column]]
 
         # Build response
-        data = {"data": data}
+        if ext == "msgpack":
+            # Raw buffers, no per-element formatting
+            times, values = data
+            if values.dtype.kind in "OSU":
+                # Raw buffers of objects would be pointers
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Column {column} is not numeric, use json",
+                )
+            body = {
+                "tdim_dtype": str(times.dtype),
+                "tdim": times.tobytes(),
+                "col_dtype": str(values.dtype),
+                "col": values.tobytes(),
+            }
+            payload = msgpack.packb(body, use_bin_type=True)
+            return Response(payload, media_type="application/x-msgpack")
+
+        # orjson only takes its numpy fast path on C-contiguous arrays
+        data = {"data": [ascontiguousarray(arr) for arr in data]}
         if ext == 'graph':
             data["options"] = uplot_options
-        response = ORJSONResponse(data)
+        payload = orjson.dumps(data, option=ORJSON_OPTIONS)
+        response = Response(payload, media_type="application/json")
 
     return response
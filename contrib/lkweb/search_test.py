@@ -0,0 +1,23 @@
+import os
+
+import pytest
+from numpy import asarray, char
+
+pytest.importorskip("fastapi")
+os.environ.setdefault("LAKOTA_REPO", "memory://")
+from lkweb.main import match_labels
+
+
+def test_match_labels():
+    labels = asarray(["Temp-Paris", "temp-london", "rain-paris", "wind"], dtype="U")
+    lower_labels = char.lower(labels)
+
+    res = match_labels(labels, lower_labels, ["paris"])
+    assert list(res) == ["Temp-Paris", "rain-paris"]
+
+    # Every pattern must match, so adding words narrows the result
+    res = match_labels(labels, lower_labels, ["paris", "temp"])
+    assert list(res) == ["Temp-Paris"]
+
+    res = match_labels(labels, lower_labels, ["paris", "snow"])
+    assert list(res) == []
@@ -1,45 +1,104 @@
+import sys
 import unicodedata
-from bisect import bisect_left, bisect_right
-from itertools import chain, islice
+from functools import lru_cache
 
 
 from numcodecs import registry
 from numpy import (
+    arange,
     concatenate,
+    cumsum,
+    empty,
     frombuffer,
-    fromiter,
-    rec,
-    repeat,
+    lexsort,
+    unique,
 )
 from sortednp import intersect
 
 from lakota import Repo, Schema, Frame
 
 
+SEP = "\x01"  # Value separator, can not be part of a trigram
+
+
+def pack_trigrams(chars):
+    """
+    Pack each (overlapping) triplet of code points of `chars` (an
+    array of unsigned integers) into one uint64. Code points fit on 21 bits so
+    the packing is lossless and the codes sort like the strings.
+    """
+    chars = chars.astype("u8")
+    return (chars[:-2] << 42) | (chars[1:-1] << 21) | chars[2:]
+
+
+def unpack_trigram(code):
+    """
+    Inverse of pack_trigrams for one code (debug only)
+    """
+    code = int(code)
+    return "".join(chr((code >> shift) & 0x1FFFFF) for shift in (42, 21, 0))
+
+
+def code_points(text):
+    """
+    Return the code points of `text` as an array of unsigned integers
+    """
+    if text.isascii():
+        # One byte per character, no need for the utf-32 round-trip
+        return frombuffer(text.encode("ascii"), dtype="u1")
+    return frombuffer(text.encode("utf-32-le"), dtype="<u4")
+
+
 def generate_trigrams(text):
-    length = len(text)
-    if length < 3:
-        return
-    a_s, b_s, c_s = (
-        islice(text, 0, length-2),
-        islice(text, 1, length-1),
-        islice(text, 2, length),
-    )
-    for a, b, c in zip(a_s, b_s, c_s):
-        yield a + b + c
+    """
+    Return an array containing the packed codes of all the
+    (overlapping) trigrams of `text`
+    """
+    if len(text) < 3:
+        return empty(0, dtype="u8")
+    return pack_trigrams(code_points(text))
 
 
+@lru_cache(maxsize=4096)
 def unidecode(text):
-    return ''.join(c for c in unicodedata.normalize('NFD', text)
-                   if unicodedata.category(c) != 'Mn')
+    """
+    Return lower-cased `text` stripped from its combining marks. Log
+    records tend to repeat the same values, hence the cache.
+    """
+    if text.isascii():
+        # Nothing to strip
+        return text.lower()
+    marks = combining_marks()
+    return ''.join(c for c in unicodedata.normalize('NFD', text.lower())
+                   if c not in marks)
+
+
+@lru_cache(maxsize=None)
+def combining_marks():
+    """
+    Return the set of all the combining marks (built on first use, it
+    takes a scan of the whole unicode range)
+    """
+    return frozenset(
+        c
+        for c in map(chr, range(sys.maxunicode + 1))
+        if unicodedata.category(c) == 'Mn'
+    )
 
 
 def ingest(record):
-    trigrams = set()
+    """
+    Return the (unique) trigrams of all the values of `record`
+    """
+    trigrams = []
     for value in record.values():
-        value = unidecode(str(value).lower()) 
-        trigrams.update(generate_trigrams(value))
-    return trigrams
+        text = unidecode(str(value))
+        if len(text) < 3:
+            continue
+        trigrams.append(generate_trigrams(text))
+    if not trigrams:
+        return empty(0, dtype="u8")
+    return unique(concatenate(trigrams))
 
 
 def test():
@@ -54,11 +113,11 @@ def test():
         } for i in range(length)],
     })
     trigram_idx = from_frame(frm, ["msg"])
-    assert len(trigram_idx) > 1 # TODO :)
+    assert len(trigram_idx["code"]) > 1 # TODO :)
 
     # Create repo and save trg-idx
     repo = Repo()
-    schema = Schema(trigram="U3*", offset="i8*")  #pos="i4"
+    schema = Schema(code="u8*", offset="i8*")  #pos="i4"
     collection = repo.create_collection(schema, "trig")
     save(trigram_idx, collection)
 
@@ -70,45 +129,81 @@ def save(trigram_idx, collection):
     checksum = "DEADBEEF"
     series = collection / checksum
     series.write({
-        "trigram": trigram_idx.trigram,
-        "offset": trigram_idx.offset,
+        "code": trigram_idx["code"],
+        "offset": trigram_idx["offset"],
     })
 
 
 def from_frame(frame, trigram_columns):
     """
     Extract string content from trigram_columns in fram. Return a
-    rec-array containing two arrays: "trigram" and "offset"
+    dict containing two arrays: "code" (the packed trigrams, see
+    pack_trigrams) and "offset"
     """
+    # Offsets are stored as u4
+    if len(frame) >= 2**32:
+        raise ValueError("Frame is too long!")
     trigrams_list = []
     ids_list = []
     for column in trigram_columns:
         if frame.schema[column].codec.dt != "O":
             raise ValueError("TODO")
-        for offset, value in enumerate(frame[column]):
-            trigrams = ingest(value)
-            trigrams_list.append(fromiter(trigrams, "U3", len(trigrams)))
-            ids_list.append(repeat(offset, len(trigrams)).astype("u4"))
-
-    # Create index & sort it
-    idx = rec.fromarrays(
-        [
-            concatenate(trigrams_list),
-            concatenate(ids_list),
-        ],
-        names=["trigram", "offset"],
-    )
-    idx.sort()
-    return idx
+        # Build one string for the whole column, values and rows are
+        # separated by SEP so trigrams spanning two values contain it
+        rows = [
+            SEP.join(unidecode(str(value)) for value in record.values())
+            for record in frame[column]
+        ]
+        if not rows:
+            continue
+        text = SEP.join(rows)
+        if len(text) < 3:
+            continue
+        chars = code_points(text)
+        trigrams = pack_trigrams(chars)
+        # Offset (aka row number) of each trigram
+        row_starts = cumsum([0] + [len(row) + 1 for row in rows[:-1]])
+        offsets = row_starts.searchsorted(arange(len(trigrams)), side="right") - 1
+        is_sep = chars == ord(SEP)
+        keep = ~(is_sep[:-2] | is_sep[1:-1] | is_sep[2:])
+        trigrams_list.append(trigrams[keep])
+        ids_list.append(offsets[keep].astype("u4"))
+
+    if not trigrams_list:
+        # No value long enough to give a trigram
+        return {
+            "code": empty(0, dtype="u8"),
+            "offset": empty(0, dtype="u4"),
+        }
+
+    # Sort by code then offset
+    codes = concatenate(trigrams_list)
+    offsets = concatenate(ids_list)
+    order = lexsort((offsets, codes))
+    codes = codes[order]
+    offsets = offsets[order]
+    # Drop repeated trigrams within a row
+    keep = empty(len(codes), dtype=bool)
+    keep[:1] = True
+    keep[1:] = (codes[1:] != codes[:-1]) | (offsets[1:] != offsets[:-1])
+    return {
+        "code": codes[keep],
+        "offset": offsets[keep],
+    }
 
 
 def search(idx, *pattern):
     res = None
-    trigrams = chain.from_iterable(generate_trigrams(p) for p in pattern)
-    for trg in trigrams:
-        start_pos = bisect_left(idx["trigram"], trg)
-        end_pos = bisect_right(idx["trigram"], trg)
-        sub_array = idx["offset"][start_pos:end_pos]
+    if not pattern:
+        return res
+    trigrams = concatenate([generate_trigrams(p) for p in pattern])
+    codes = idx["code"]
+    offsets = idx["offset"]
+    # Locate all the trigrams at once
+    starts = codes.searchsorted(trigrams, side="left")
+    stops = codes.searchsorted(trigrams, side="right")
+    for start_pos, end_pos in zip(starts, stops):
+        sub_array = offsets[start_pos:end_pos]
         if res is None:
             res = sub_array
         else:
@@ -5,7 +5,7 @@ from random import random
 from time import sleep
 
 from .commit import Commit
-from .utils import Pool, hexdigest, hexhash_len, hextime
+from .utils import Pool, hexdigest, hexhash_len, hextime, tail
 
 zero_hextime = "0" * 11
 zero_hash = "0" * hexhash_len
@@ -23,6 +23,8 @@ class Changelog:
     def __init__(self, pod):
         self.pod = pod
         self._log_cache = None
+        self._last_log = (None, None)  # Filenames and revisions
+        self._known = {}  # Revisions from previous log, by path
 
     def commit(self, payload, parents=None, _jitter=False):
         assert isinstance(payload, bytes)
@@ -55,22 +57,31 @@ class Changelog:
             child = hextime() + "-" + key
             revision = Revision(self, parent, child)
             self.pod.write(revision.path, payload)
+            # Payload is already hashed, no need to read it back
+            revision._payload = payload
             revs.append(revision)
 
         self.refresh()
+        self._known.update((rev.path, rev) for rev in revs)
         return revs
 
     def refresh(self):
+        # Keep previous revisions around, so that their payloads (and
+        # decoded commits) survive the next log
+        if self._log_cache is not None:
+            self._known = {rev.path: rev for rev in self._log_cache}
         self._log_cache = None
 
     def __iter__(self):
         yield from self.pod.ls(missing_ok=True)
 
     def leaf(self, before=None):
-        revisions = self.log(before=before)
-        if not revisions:
-            return None
-        return revisions[-1]
+        if before is None:
+            revisions = self.log()
+            return revisions[-1] if revisions else None
+        # Only keep the last matching revision in memory
+        last = tail(self._before(before))
+        return last[0] if last else None
 
     def leafs(self):
         return [rev for rev in self.log() if rev.is_leaf]
@@ -80,59 +91,97 @@ class Changelog:
         Create a list of all the active revisions
         """
         if self._log_cache is None:
-            self._log_cache = list(self._log())
+            names = frozenset(self)
+            last_names, last_revs = self._last_log
+            if names == last_names:
+                # Nothing changed since the last log, the previous
+                # revisions are still valid
+                self._log_cache = last_revs
+            else:
+                self._log_cache = list(self._log(names))
+                self._last_log = (names, self._log_cache)
+            self._known = {}
         if before is not None:
-            if isinstance(before, datetime):
-                before = hextime(before.timestamp())
-            cond = lambda rev: rev.epoch < before
-            return list(takewhile(cond, self._log_cache))
+            return list(self._before(before))
         return self._log_cache
 
-    def _log(self):
+    def _before(self, before):
+        """
+        Iterate on the revisions older than `before`
+        """
+        if isinstance(before, datetime):
+            before = hextime(before.timestamp())
+        cond = lambda rev: rev.epoch < before
+        return takewhile(cond, self.log())
+
+    def _log(self, names):
         # Extract parent->children relations
         revisions = defaultdict(list)
         all_children = set()
-        for name in sorted(self):
-            parent, child = name.split(".")
+        known_revs = self._known
+        # Names are sorted with a plain string sort (a numpy sort +
+        # char.partition on the names array is several times slower)
+        for name in sorted(names):
+            parent, _, child = name.partition(".")
             if parent == child:
                 continue
             all_children.add(child)
-            revisions[parent].append(Revision(self, parent, child))
+            rev = Revision(self, parent, child)
+            if known_revs:
+                known = known_revs.get(name)
+                if known is not None:
+                    rev._payload, rev._commit = known._payload, known._commit
+            revisions[parent].append(rev)
 
         # `revision` is sorted low to high (because filled based on
         # `sorted(self)`, so `queue` is sorted too (high to low). This
         # means the last revision to be yielded is the last child of
         # the first branch (aka oldest parent)
         parent_revs = [r for r in revisions if r not in all_children]
-        first_gen = list(chain.from_iterable(revisions[p] for p in parent_revs))
-        queue = list(reversed(first_gen))
+        queue = list(chain.from_iterable(revisions[p] for p in parent_revs))
+        queue.reverse()  # in place, no need for a second list
 
         # Depth first traversal of the tree(see
         # https://stackoverflow.com/a/5278667)
         yielded = set()
+        no_children = ()
         while queue:
             rev = queue.pop()
-            # Append children
-            children = [] if rev.child in yielded else revisions[rev.child]
-            yielded.add(rev.child)
+            # Append children (get avoids filling `revisions` with
+            # empty lists for each leaf)
+            child = rev.child
+            if child in yielded:
+                children = no_children
+            else:
+                children = revisions.get(child, no_children)
+                yielded.add(child)
             # Set is_leaf attribute, fill queue with next generation
             # and yield
             rev.is_leaf = not children
+            if children:
+                # Not a leaf (anymore), drop its decoded commit
+                rev._commit = None
             queue.extend(reversed(children))
             yield rev
 
-    def pull(self, remote, shallow=False):
+    def pull(self, remote, shallow=False, revisions=None):
+        """
+        Copy remote revisions into self. If `revisions` is given, it
+        must contain the remote revisions not yet known locally.
+        """
         new_paths = []
-        local_digests = set(r.digests for r in self.log())
-        remote_revs = remote.leafs() if shallow else remote.log()
+        if revisions is None:
+            local_digests = set(r.digests for r in self.log())
+            remote_revs = remote.leafs() if shallow else remote.log()
+            revisions = [r for r in remote_revs if r.digests not in local_digests]
+        # Read and write in the same task, so that remote and local
+        # round-trips overlap
+        sync = lambda path: self.pod.write(path, remote.pod.read(path))
         with Pool() as pool:
-            for remote_rev in remote_revs:
-                if remote_rev.digests in local_digests:
-                    continue
+            for remote_rev in revisions:
                 path = remote_rev.path
                 new_paths.append(path)
-                payload = remote.pod.read(path)
-                pool.submit(self.pod.write, path, payload)
+                pool.submit(sync, path)
         self.refresh()
         return new_paths
 
@@ -143,12 +192,17 @@ RevDigest = namedtuple("RevDigest", ["parent", "child"])
 class Revision:
     # This could be implemented as a dataclass (__init__ contains no
     # logic)
+
+    # One instance per revision file is kept in the changelog cache
+    __slots__ = ("changelog", "parent", "child", "is_leaf", "_payload", "_commit")
+
     def __init__(self, changelog, parent, child):
         self.changelog = changelog
         self.parent = parent
         self.child = child
         self.is_leaf = False
         self._payload = None
+        self._commit = None
 
     @classmethod
     def from_path(cls, changelog, path):
@@ -190,5 +244,13 @@ class Revision:
         """
         Instanciate commit based on self payload and series schema
         """
-        payload = self.read()
-        return Commit.decode(collection.schema, payload)
+        # Revision content is immutable, the decoded commit can be
+        # reused across reads. Only leaf commits (the ones new writes
+        # build upon) are kept, otherwise the whole decoded history
+        # would stay in memory
+        ci = self._commit
+        if ci is None or ci.schema is not collection.schema:
+            ci = Commit.decode(collection.schema, self.read())
+            if self.is_leaf:
+                self._commit = ci
+        return ci
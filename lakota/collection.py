@@ -95,9 +95,13 @@ class Collection:
         rev = self.changelog.leaf()
         if rev is None:
             return []
-        payload = rev.read()
-        ci = Commit.decode(self.schema, payload)
-        return sorted(set(ci.label))
+        labels = rev.commit(self).label
+        if len(labels) == 0:
+            return []
+        # Commit rows are sorted on label, so we only have to drop
+        # consecutive duplicates
+        keep = labels[1:] != labels[:-1]
+        return [labels[0]] + list(labels[1:][keep])
 
     def delete(self, *labels):
         leaf_rev = self.changelog.leaf()
@@ -175,16 +179,20 @@ class Collection:
                 continue
 
             # build digest & embed arrays (based on zeroes arrays)
-            values = [[default_value] * l for l in leaf_ci.length]
             sch_col = other_schema[col]
             col_embedded = {}
 
-            # Compute digest and fill all_dig
+            # Compute digest and fill all_dig, arrays only depend on
+            # row length, so each distinct length is encoded once
             all_dig[col] = []
-            for v in values:
-                arr = sch_col.cast(asarray(v))
-                encoded, digest = sch_col.codec.encode(arr, with_digest=True)
-                col_embedded[digest] = encoded
+            len2dig = {}
+            for l in leaf_ci.length:
+                digest = len2dig.get(l)
+                if digest is None:
+                    arr = sch_col.cast(asarray([default_value] * l))
+                    encoded, digest = sch_col.codec.encode(arr, with_digest=True)
+                    col_embedded[digest] = encoded
+                    len2dig[l] = digest
                 # Add new coll to digest dict
                 all_dig[col].append(digest)
 
@@ -216,21 +224,41 @@ class Collection:
         """
         assert isinstance(remote, Collection), "A Collection instance is required"
 
-        local_digs = set(self.digests())
+        local_revs = self.changelog.log()
+        local_digs = set(self.digests(local_revs))
         if shallow:
-            remote_digs = set(remote.digests(remote.changelog.leafs()))
+            remote_revs = remote.changelog.leafs()
         else:
-            remote_digs = set(remote.digests())
-        sync = lambda path: self.pod.write(path, remote.pod.read(path))
-        with Pool() as pool:
-            for dig in remote_digs:
-                if dig in local_digs:
+            remote_revs = remote.changelog.log()
+        # Segments of revisions already present locally have been
+        # synced with them, no need to decode those commits again
+        known = set(rev.digests for rev in local_revs)
+        remote_revs = [rev for rev in remote_revs if rev.digests not in known]
+        remote_digs = set(remote.digests(remote_revs))
+
+        # Group segments by folder, so that the ones already there
+        # (interrupted pull, shared pod) are found with one listing per
+        # folder and never read from the remote
+        by_folder = defaultdict(list)
+        for dig in remote_digs - local_digs:
+            folder, filename = hashed_path(dig)
+            by_folder[folder].append(filename)
+
+        def sync(folder, filenames):
+            existing = set(self.pod.ls(folder, missing_ok=True))
+            for filename in filenames:
+                if filename in existing:
                     continue
-                folder, filename = hashed_path(dig)
                 path = folder / filename
-                pool.submit(sync, path)
+                self.pod.write(path, remote.pod.read(path))
+
+        with Pool() as pool:
+            for folder, filenames in by_folder.items():
+                pool.submit(sync, folder, filenames)
 
-        self.changelog.pull(remote.changelog, shallow=shallow)
+        # Revisions are already filtered, no need to walk both
+        # changelogs again
+        self.changelog.pull(remote.changelog, revisions=remote_revs)
 
     def merge(self, *heads):
         revisions = self.changelog.log()
@@ -250,11 +278,11 @@ class Collection:
         for r in revisions:
             ch2pr[r.child].append(r)
 
-        # Find common root
+        # Find common root (ancestors of the other heads are kept in
+        # sets, so that each lookup is O(1) on long histories)
         root = None
-        first_parents, *other_parents = [
-            list(self._find_parents(h, ch2pr)) for h in heads
-        ]
+        first_parents = list(self._find_parents(heads[0], ch2pr))
+        other_parents = [set(self._find_parents(h, ch2pr)) for h in heads[1:]]
         for root in first_parents:
             if all(root in op for op in other_parents):
                 break
@@ -388,28 +416,36 @@ class Collection:
         Find the first "small" segment , and return its start values.
         """
         assert max_chunk > 0, "Parameter 'max_chunk' must be bigger than 0"
-        rows = list(commit.match(series.label))
-        if len(rows) <= max_chunk:
-            return rows[-1]["stop"], "RIGHT"
+        # Work on the length column instead of building every row
+        positions = commit.positions(series.label)
+        last = commit.at(positions[-1])
+        if len(positions) <= max_chunk:
+            return last["stop"], "RIGHT"
 
         # Define a minimal acceptable len
-        total_len = sum(row["length"] for row in rows)
-        threshold = min(settings.page_len, total_len / (max_chunk + 1))
+        lengths = asarray(commit.length[positions.start : positions.stop])
+        threshold = min(settings.page_len, lengths.sum() / (max_chunk + 1))
 
-        for row in rows[:-1]:
-            # Stop at first small row
-            if row["length"] < threshold:
-                return row["start"], "BOTH"
-        return rows[-1]["stop"], "RIGHT"
+        # Stop at first small row
+        small = (lengths[:-1] < threshold).nonzero()[0]
+        if len(small):
+            row = commit.at(positions[small[0]])
+            return row["start"], "BOTH"
+        return last["stop"], "RIGHT"
 
     def digests(self, revisions=None):
         if revisions is None:
             revisions = self.changelog.log()
+        # Successive commits share most of their rows, keep track of
+        # digests already yielded
+        seen = set()
         for rev in revisions:
             ci = rev.commit(self)
             digs = set(chain.from_iterable(ci.digest.values()))
             # return only digest not already embedded in the commit
-            digs = digs - set(ci.embedded)
+            digs -= ci.embedded.keys()
+            digs -= seen
+            seen |= digs
             yield from digs
 
     @contextmanager
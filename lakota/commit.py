@@ -129,12 +129,12 @@ timestamp,value
 from itertools import chain
 from threading import Lock
 
-from numcodecs import registry
-from numpy import asarray, concatenate, isin, repeat, where
+import msgpack
+from numpy import asarray, concatenate, isin, repeat
 
 from .frame import Frame
-from .schema import Codec, Schema
-from .utils import Closed, Pool, hashed_path
+from .schema import Codec
+from .utils import Closed, Pool, bisect_columns, hashed_path
 
 __all__ = ["Commit", "Segment"]
 
@@ -146,13 +146,28 @@ class Commit:
     label_codec = Codec("str")
     closed_codec = Codec("str")  # Could be i1
 
-    def __init__(self, schema, label, start, stop, digest, length, closed, embedded):
+    def __init__(
+        self,
+        schema,
+        label,
+        start,
+        stop,
+        digest,
+        length,
+        closed,
+        embedded,
+        raw_digest=False,
+    ):
         assert list(digest) == list(schema)
         self.schema = schema
         self.label = label  # Array of str
         self.start = start  # Dict of Arrays
         self.stop = stop  # Dict of arrays
-        self.digest = digest  # Dict of arrays
+        if raw_digest:
+            # Encoded digests, decoded on first access
+            self._digest, self._raw_digest = None, digest
+        else:
+            self._digest, self._raw_digest = digest, None
         self.length = length  # Array of int
         self.closed = closed  # Array of ("l", "r", "b", "n")
         self.embedded = embedded or {}
@@ -180,17 +195,19 @@ class Commit:
 
     @classmethod
     def decode(cls, schema, payload):
-        msgpck = registry.codec_registry["msgpack2"]()
-        data = msgpck.decode(payload)[0]
+        # Payload is a msgpack2-encoded one-element object array,
+        # unpack it directly instead of boxing it into numpy
+        data = msgpack.unpackb(payload, raw=False)[0]
         values = {}
-        # Decode starts, stops and digests
-        for key in ("start", "stop", "digest"):
-            key_vals = {}
-            columns = schema if key == "digest" else schema.idx
-            for name in columns:
-                codec = cls.digest_codec if key == "digest" else schema[name].codec
-                key_vals[name] = codec.decode(data[key][name])
-            values[key] = key_vals
+        # Decode starts and stops
+        for key in ("start", "stop"):
+            values[key] = {
+                name: schema[name].codec.decode(data[key][name]) for name in schema.idx
+            }
+        # Digests are only needed for matching rows, they are decoded
+        # on first access
+        values["digest"] = {name: data["digest"][name] for name in schema}
+        values["raw_digest"] = True
 
         # Decode len and labels
         values["length"] = cls.len_codec.decode(data["length"])
@@ -201,24 +218,33 @@ class Commit:
         values["embedded"] = data.get("embedded")
         return Commit(schema, **values)
 
+    @property
+    def digest(self):
+        if self._digest is None:
+            self._digest = {
+                name: self.digest_codec.decode(buff)
+                for name, buff in self._raw_digest.items()
+            }
+        return self._digest
+
     def encode(self):
-        msgpck = registry.codec_registry["msgpack2"]()
         data = {}
-        # Encode starts, stops and digests
-        for key in ("start", "stop", "digest"):
-            columns = self.schema if key == "digest" else self.schema.idx
-            key_vals = {}
-            for pos, name in enumerate(columns):
-                codec = (
-                    self.digest_codec if key == "digest" else self.schema[name].codec
-                )
-                arr = getattr(self, key)[name]
-                key_vals[name] = codec.encode(arr)
-            data[key] = key_vals
+        # Encode starts and stops
+        for key in ("start", "stop"):
+            values = getattr(self, key)
+            data[key] = {
+                name: self.schema[name].codec.encode(values[name])
+                for name in self.schema.idx
+            }
 
         # Encode digests
-        for name in self.schema:
-            data["digest"][name] = self.digest_codec.encode(self.digest[name])
+        if self._digest is None:
+            data["digest"] = dict(self._raw_digest)
+        else:
+            data["digest"] = {
+                name: self.digest_codec.encode(self.digest[name])
+                for name in self.schema
+            }
 
         # Encode length, closed and labels
         data["length"] = self.len_codec.encode(self.length)
@@ -230,19 +256,23 @@ class Commit:
         )
         embedded = {d: self.embedded[d] for d in sorted(keep_digests)}
         data["embedded"] = embedded
-        return msgpck.encode([data])
+        # Same bytes as the msgpack2 codec on `[data]`: the item list
+        # followed by the dtype and shape of the array
+        return msgpack.packb([data, "|O", (1,)], use_bin_type=True)
 
     def split(self, label, start, stop):
-        start_values = {"_label": self.label}
-        start_values.update(self.start)
-        stop_values = {"_label": self.label}
-        stop_values.update(self.stop)
-        frm_start = Frame(Schema.from_frame(start_values), start_values)
-        frm_stop = Frame(Schema.from_frame(stop_values), stop_values)
-        start_pos = frm_stop.index((label,) + start, right=True)
-        stop_pos = frm_start.index((label,) + stop, right=False)
+        start_pos = self._bisect(self.stop, (label,) + start, right=True)
+        stop_pos = self._bisect(self.start, (label,) + stop, right=False)
         return start_pos, stop_pos
 
+    def _bisect(self, bounds, values, right=False):
+        """
+        Binary search of `values` on label and on the index columns of
+        `bounds` (self.start or self.stop), see `bisect_columns`
+        """
+        columns = [self.label] + [bounds[n] for n in self.schema.idx]
+        return bisect_columns(columns, values, right=right)
+
     def __len__(self):
         return len(self.label)
 
@@ -264,15 +294,14 @@ class Commit:
         closed = Closed.cast(closed)
         if not start <= stop:
             raise ValueError(f"Invalid range {start} -> {stop}")
+        # Build a new dict, self may be shared (cached leaf commit)
+        embedded = {**self.embedded, **embedded} if embedded else self.embedded
         inner = Commit.one(
             self.schema, label, start, stop, digest, length, closed, embedded
         )
         if len(self) == 0:
             return inner
 
-        if embedded:
-            self.embedded.update(embedded)
-
         first = (self.at(0)["label"], self.at(0)["start"])
         last = (self.at(-1)["label"], self.at(-1)["stop"])
         if (label, start) < first and (label, stop) > last:
@@ -417,12 +446,35 @@ class Commit:
         )
         return f"<Commit {items}>"
 
-    def match(self, label):
-        (matches,) = where(self.label == label)
-        for pos in matches:
+    def match(self, label, start=None, stop=None, reverse=False):
+        for pos in self.positions(label, start, stop, reverse=reverse):
             yield self.at(pos)
 
-    def segments(self, label, pod, start=None, stop=None, closed=Closed.BOTH):
+    def positions(self, label, start=None, stop=None, reverse=False):
+        """
+        Return the range of row positions for `label`, narrowed to
+        the rows that may intersect [start, stop]
+        """
+        # Rows are sorted on label, so matches are contiguous
+        lo = int(self.label.searchsorted(label, side="left"))
+        hi = int(self.label.searchsorted(label, side="right"))
+        # Rows of a given label do not overlap, so both their starts
+        # and their stops are sorted. We use the first index column to
+        # skip rows that are fully outside of [start, stop] (exact
+        # boundaries are left to the caller)
+        first = next(iter(self.schema.idx))
+        if start and lo < hi:
+            arr = self.stop[first][lo:hi]
+            lo += int(arr.searchsorted(start[0], side="left"))
+        if stop and lo < hi:
+            arr = self.start[first][lo:hi]
+            hi = lo + int(arr.searchsorted(stop[0], side="right"))
+        positions = range(lo, hi)
+        return reversed(positions) if reverse else positions
+
+    def segments(
+        self, label, pod, start=None, stop=None, closed=Closed.BOTH, reverse=False
+    ):
         closed = Closed.cast(closed)
 
         # If start (or stop) is not set, and the left (right) side is
@@ -434,13 +486,25 @@ class Commit:
             closed = closed.set_right(True)
 
         # XXX allow to pass condition instead of simple start-stop ?
-        for row in self.match(label):
-            arr_start = row["start"]
-            arr_stop = row["stop"]
-            arr_closed = Closed[row["closed"]]
+        # Rows do not overlap and are sorted on start, so once we are
+        # past the requested range no later row can match
+        # Only extract the bounds of each row (and its digests once
+        # selected) instead of building full rows with `at`
+        # Bind columns once, outside of the loop
+        idx = list(self.schema.idx)
+        start_cols = [self.start[n] for n in idx]
+        stop_cols = [self.stop[n] for n in idx]
+        closed_col = self.closed
+        digest_cols = None  # Only decoded if a segment is yielded
+        for pos in self.positions(label, start, stop, reverse=reverse):
+            arr_start = tuple(col[pos] for col in start_cols)
+            arr_stop = tuple(col[pos] for col in stop_cols)
+            arr_closed = Closed[closed_col[pos]]
             if start:
                 if start > arr_stop:
                     # start is on the right of the array
+                    if reverse:
+                        break
                     continue
                 elif not arr_closed.right and start == arr_stop:
                     # Same
@@ -456,7 +520,9 @@ class Commit:
 
             if stop:
                 if stop < arr_start:
-                    continue
+                    if reverse:
+                        continue
+                    break
                 elif not arr_closed.left and stop == arr_start:
                     continue
                 elif stop < arr_stop:
@@ -465,10 +531,12 @@ class Commit:
                     arr_stop = stop
                 elif stop == arr_stop and arr_closed.right:
                     arr_closed = arr_closed.set_right(closed.right)
+            if digest_cols is None:
+                digest_cols = [self.digest[n] for n in self.schema]
             yield Segment(
                 self,
                 pod,
-                row["digest"],
+                tuple(col[pos] for col in digest_cols),
                 start=arr_start,
                 stop=arr_stop,
                 closed=arr_closed,
@@ -544,10 +612,10 @@ class Segment:
         data = self.commit.embedded.get(dig)
         if data is None:
             folder, filename = hashed_path(dig)
-            sub_pod = self.pod.cd(folder)
             try:
-                data = sub_pod.read(filename)
+                data = self.pod.read(folder / filename)
             except FileNotFoundError:
+                sub_pod = self.pod.cd(folder)
                 for f in sub_pod.ls():
                     # File is in soft-delete mode
                     if f.startswith(filename):
@@ -567,12 +635,14 @@ class Segment:
             if self._frm is not None:
                 return self._frm
 
-            cols = {}
-            # with Pool() as pool: # TODO need a smarter pool
-            #     for name in self.commit.schema.idx:
-            #         pool.submit(lambda: cols.update({name: self._read(name)}))
-            for name in self.commit.schema.idx:
-                cols[name] = self._read(name)
+            # Index columns are fetched and decoded concurrently (Pool
+            # falls back to sequential reads when already nested in
+            # another pool)
+            read_col = lambda name: (name, self._read(name))
+            with Pool() as pool:
+                for name in self.commit.schema.idx:
+                    pool.submit(read_col, name)
+            cols = dict(pool.results)
 
             frm = Frame(self.commit.schema, cols)
             self.start_pos, self.stop_pos = frm.slice_index(
@@ -1,8 +1,6 @@
-from bisect import bisect_left, bisect_right
 from collections import defaultdict
 
 from numpy import (
-    arange,
     argsort,
     array_equal,
     asarray,
@@ -14,7 +12,7 @@ from numpy import (
 
 from .schema import Schema
 from .sexpr import AST, Alias
-from .utils import Closed, Pool, as_tz, floor, pivot, pretty_nb
+from .utils import Closed, Pool, as_tz, bisect_columns, floor, pivot, pretty_nb
 
 try:
     from pandas import DataFrame
@@ -44,11 +42,17 @@ class Frame:
         """
         self.schema = schema
         if DataFrame is not None and isinstance(columns, DataFrame):
-            columns = {c: columns[c].values for c in columns}
+            # Only extract the columns known by the schema
+            columns = {
+                c: columns[c].values for c in columns if c in schema.columns
+            }
         self.columns = schema.cast(
             columns
         )  # XXX create empty list if one column is missing ?
         self.env = {}
+        # Length is fixed at creation (__setitem__ enforces it)
+        first = next(iter(self.columns.values()), None)
+        self._len = 0 if first is None else len(first)
 
     @classmethod
     def from_records(self, schema, records):
@@ -63,31 +67,42 @@ class Frame:
 
         start = offset or 0
         stop = None if limit is None else start + limit
-        frames = []
 
-        for sgm in segments:
-            if stop == 0:
-                break
-            if start >= len(sgm):
-                start = max(start - len(sgm), 0)
+        if start == 0 and stop is None:
+            # No pagination, so no need to know segment lengths upfront
+            slices = [(sgm, None, None) for sgm in segments]
+        else:
+            # Find the part of each segment that falls in [start, stop)
+            slices = []
+            for sgm in segments:
+                if stop == 0:
+                    break
+                length = len(sgm)
+                if start < length:
+                    slices.append((sgm, start, stop))
+                start = max(start - length, 0)
                 if stop is not None:
-                    stop = max(stop - len(sgm), 0)
-                continue
-            with Pool() as pool:
-                # For each column we schedule a lambda that return a tuple
-                # `(name, numpy_array)`
-                read_col = lambda name: (
-                    name,
-                    sgm.read(name, start_pos=start, stop_pos=stop)
-                )
-                for name in select:
-                    pool.submit(read_col, name)
-            values = dict(pool.results)
-            frames.append(Frame(schema, values))
+                    stop = max(stop - length, 0)
+        return cls.from_slices(schema, slices, select)
 
-            start = max(start - len(sgm), 0)
-            if stop is not None:
-                stop = max(stop - len(sgm), 0)
+    @classmethod
+    def from_slices(cls, schema, slices, select):
+        """
+        Build a frame out of `slices`, a list of `(segment, start_pos,
+        stop_pos)` tuples, keeping only the `select` columns
+        """
+        # Submit the reads of all slices in one batch
+        read_col = lambda sgm, name, start, stop: sgm.read(name, start, stop)
+        with Pool() as pool:
+            for sgm, start, stop in slices:
+                for name in select:
+                    pool.submit(read_col, sgm, name, start, stop)
+        results = iter(pool.results)
+        frames = []
+        for _ in slices:
+            frm = Frame(schema, {name: next(results) for name in select})
+            if len(frm) > 0:
+                frames.append(frm)
 
         # Return collected frames
         if frames:
@@ -102,8 +117,16 @@ class Frame:
     def df(self, *columns):
         if DataFrame is None:
             raise ModuleNotFoundError("No module named 'pandas'")
-        return DataFrame({c: self[c] for c in self.schema.columns
-                          if c in self.columns})
+        data = {}
+        for name in self.schema.columns:
+            arr = self.columns.get(name)
+            if arr is None:
+                continue
+            # Arrays are already typed and aligned, let pandas use them
+            # as is, except read-only ones (decoded buffers) so that the
+            # dataframe stays writable
+            data[name] = arr if arr.flags.writeable else arr.copy()
+        return DataFrame(data, copy=False)
 
     def argsort(self, *sort_columns):
         sort_columns = sort_columns or list(self.schema.idx)
@@ -112,16 +135,27 @@ class Frame:
         return argsort(arr, kind="mergesort")
 
     def is_sorted(self):
-        idx_cols = list(self.schema.idx)
-        if len(idx_cols) == 1:
-            arr = self[idx_cols[0]]
-            return all(arr[1:] >= arr[:-1])
-
-        # Multi-column index we fallback on argsort
-        arr = rec.fromarrays([self[n] for n in idx_cols], names=idx_cols)
-        sort_mask = self.argsort()
-        a_range = arange(len(sort_mask))
-        return all(sort_mask == a_range)
+        # Compare each index column with its shifted self, a column only
+        # matters where all the previous ones are tied (O(n), no sort)
+        ties = None
+        idx = list(self.schema.idx)
+        for name in idx:
+            arr = self.columns[name]
+            head, tail = arr[:-1], arr[1:]
+            ordered = tail >= head
+            if ties is not None:
+                ordered |= ~ties
+            if not ordered.all():
+                return False
+            if name == idx[-1]:
+                # No more columns to break ties (single column index
+                # needs no tie array at all)
+                break
+            equal = tail == head
+            ties = equal if ties is None else ties & equal
+            if not ties.any():
+                break
+        return True
 
     @classmethod
     def concat(cls, *frames):
@@ -140,18 +174,31 @@ class Frame:
             if not frm.schema == schema:
                 msg = "Unable to concat frames with different schema"
                 raise ValueError(msg)
+            columns = frm.columns
             for name in names:
-                arr = frm[name]
+                arr = columns[name]
                 if len(arr) == 0:
                     continue
                 cols[name].append(arr)
         # Concatenate all lists
         for name in names:
-            cols[name] = concatenate(cols[name])
+            arrays = cols[name]
+            if len(arrays) == 1:
+                # Only one non-empty array, no need to copy it
+                cols[name] = arrays[0]
+            elif arrays:
+                cols[name] = concatenate(arrays)
+            else:
+                # All arrays are empty
+                cols[name] = frames[0].columns[name]
         # Create frame
         return Frame(schema, cols)
 
     def sorted(self, *sort_columns):
+        if not sort_columns and len(self) > 0 and self.is_sorted():
+            # Nothing to do, avoid argsort and copy (columns are shared
+            # like with slice)
+            return Frame(self.schema, dict(self.columns))
         return self.mask(self.argsort(*sort_columns))
 
     def mask(self, mask, env=None):
@@ -160,8 +207,7 @@ class Frame:
             mask = self.eval(mask, env=env)
         cols = {}
         # Apply mask to each column
-        for name in self.columns:
-            arr = self.columns[name]
+        for name, arr in self.columns.items():
             if len(arr) == 0:
                 continue
             cols[name] = arr[mask]
@@ -193,22 +239,19 @@ class Frame:
         if start:
             idx_start = self.index(start, right=not closed.left)
         if stop:
-            idx_stop = self.index(stop, right=closed.right)
+            # Stop can not be before start, restart from there
+            idx_stop = self.index(stop, right=closed.right, lo=idx_start or 0)
         return idx_start, idx_stop
 
-    def index(self, values, right=False):
+    def index(self, values, right=False, lo=0):
+        """
+        Return the position of `values` in the index columns, the
+        search starts at position `lo`
+        """
         if not values:
             return None
-        lo = 0
-        hi = len(self)
-        for name, val in zip(self.schema.idx, values):
-            arr = self.columns[name]
-            lo = bisect_left(arr, val, lo=lo, hi=hi)
-            hi = bisect_right(arr, val, lo=lo, hi=hi)
-
-        if right:
-            return hi
-        return lo
+        columns = [self.columns[name] for name in self.schema.idx]
+        return bisect_columns(columns, values, right=right, lo=lo)
 
     def slice(self, start=None, stop=None):
         """
@@ -217,9 +260,7 @@ class Frame:
         # Replace None by actual values
         slc = slice(*(slice(start, stop).indices(len(self))))
         # Build new frame
-        cols = {}
-        for name in self.columns:
-            cols[name] = self.columns[name][slc]
+        cols = {name: arr[slc] for name, arr in self.columns.items()}
         return Frame(self.schema, cols)
 
     def islice(self, start=None, stop=None, closed="l"):
@@ -231,7 +272,16 @@ class Frame:
 
     def __eq__(self, other):
         other = self.schema.cast(other)
-        return all(array_equal(self[c], other[c]) for c in self.schema.columns)
+        for c in self.schema.columns:
+            left, right = self.columns[c], other[c]
+            if left is right and left.dtype.kind not in "fcmMO":
+                # Same array, skip the scan (unless it can hold NaN or
+                # NaT, that are not equal to themselves)
+                continue
+            # Check shapes first to avoid a full scan on obvious mismatch
+            if left.shape != right.shape or not array_equal(left, right):
+                return False
+        return True
 
     def get(self, name, default=None):
         return self.columns.get(name, default)
@@ -240,10 +290,7 @@ class Frame:
         return column in self.columns
 
     def __len__(self):
-        if not self.columns:
-            return 0
-        values, *_ = self.columns.values()
-        return len(values)
+        return self._len
 
     def keys(self):
         return list(self.columns)
@@ -269,10 +316,16 @@ class Frame:
             yield dict(zip(keys, vals))
 
     def start(self):
-        return self.schema.row(self, pos=0, full=False)
+        return self._idx_row(0)
 
     def stop(self):
-        return self.schema.row(self, pos=-1, full=False)
+        return self._idx_row(-1)
+
+    def _idx_row(self, pos):
+        # Read index values straight from the column arrays (bypass
+        # the generic dispatch of __getitem__)
+        columns = self.columns
+        return tuple(columns[n][pos] for n in self.schema.idx)
 
     def __setitem__(self, name, arr):
         # Make sure we have a numpy array
@@ -3,6 +3,11 @@ from pathlib import PurePosixPath
 
 import requests
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .pod import POD
 from .utils import logger
 
@@ -36,7 +41,13 @@ class HttpPOD(POD):
             raise FileNotFoundError(f"{relpath} not found")
         else:
             resp.raise_for_status()
-        return resp.json()["body"]
+        return json_loads(resp.content)["body"]
+
+    def isfile(self, relpath):
+        # No dedicated endpoint, look for the name in the parent
+        # listing (that does not tell files and folders apart)
+        relpath = PurePosixPath(relpath)
+        return relpath.name in self.ls(relpath.parent, missing_ok=True)
 
     @POD.capture_metric
     def read(self, relpath, mode="rb"):
@@ -48,7 +59,7 @@ class HttpPOD(POD):
             raise FileNotFoundError(f"{relpath} not found")
         else:
             resp.raise_for_status()
-        return base64.b64decode(resp.json()["body"])
+        return base64.b64decode(json_loads(resp.content)["body"])
 
     @POD.capture_metric
     def write(self, relpath, data, mode="wb", force=False):
@@ -57,7 +68,7 @@ class HttpPOD(POD):
         params = {"path": str(path), "force": "true" if force else ""}
         resp = self.session.post(self.base_uri + "write", params=params, data=data)
         resp.raise_for_status()
-        body = resp.json()["body"]
+        body = json_loads(resp.content)["body"]
         return body
 
     def rm(self, relpath=".", recursive=False, missing_ok=False):
@@ -103,5 +114,5 @@ class HttpPOD(POD):
 
         resp = self.session.get(self.base_uri + "walk", params=params)
         resp.raise_for_status()
-        body = resp.json()["body"]
+        body = json_loads(resp.content)["body"]
         return body
@@ -199,13 +199,40 @@ class FilePOD(POD):
 
     @POD.capture_metric
     def write(self, relpath, data, mode="wb", force=False):
-        if not force and self.isfile(relpath):
+        path = self.path / relpath
+        if "b" not in mode:
+            if not force and path.is_file():
+                logger.debug("SKIP-WRITE %s %s", self.path, relpath)
+                return
+            logger.debug("WRITE %s %s", self.path, relpath)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open(mode) as fh:
+                return fh.write(data)
+
+        # O_EXCL combines the existence check and the file creation in
+        # one syscall, parent folders are only created when missing
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if force else os.O_EXCL)
+        try:
+            try:
+                fd = os.open(path, flags, 0o666)
+            except FileNotFoundError:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(path, flags, 0o666)
+        except FileExistsError:
             logger.debug("SKIP-WRITE %s %s", self.path, relpath)
             return
         logger.debug("WRITE %s %s", self.path, relpath)
-        path = self.path / relpath
-        path.parent.mkdir(parents=True, exist_ok=True)
-        return path.open(mode).write(data)
+        # Write bytes directly on the file descriptor, bypassing the
+        # buffered io layer (and its extra copy). The view is cast to
+        # bytes, os.write counts bytes and data may be an array
+        view = memoryview(data).cast("B")
+        nbytes = view.nbytes
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        return nbytes
 
     def isdir(self, relpath):
         return self.path.joinpath(relpath).is_dir()
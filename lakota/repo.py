@@ -128,9 +128,14 @@ class Repo:
         self.pod = pod
         path = folder / filename
         self.registry = Collection("registry", self.schema, path, self)
+        # Registry frames by namespace, with the leaf revision they
+        # were read from
+        self._registry_cache = {}
 
-    def ls(self):
-        return [item.label for item in self.search()]
+    def ls(self, namespace="collection"):
+        # Only read the label column, no need to decode schemas
+        series = self.registry.series(namespace)
+        return list(series.frame(select="label")["label"])
 
     def __iter__(self):
         return self.search()
@@ -149,17 +154,29 @@ class Repo:
         return self.collection(name)
 
     def collection(self, label, from_frm=None, namespace="collection"):
-        series = self.registry.series(namespace)
-        if from_frm:
-            frm = from_frm.islice([label], [label], closed="BOTH")
-        else:
-            frm = series.frame(start=label, stop=label, closed="BOTH")
+        from_frm = from_frm or self._registry_frame(namespace)
+        frm = from_frm.islice([label], [label], closed="BOTH")
 
         if frm.empty:
             return None
         meta = frm["meta"][-1]
         return self.reify(label, meta)
 
+    def _registry_frame(self, namespace="collection"):
+        """
+        Return the registry content for `namespace`. Revisions are
+        immutable, so the frame is only read again when the registry
+        leaf changes.
+        """
+        leaf = self.registry.changelog.leaf()
+        key = leaf and leaf.path
+        cached = self._registry_cache.get(namespace)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        frm = self.registry.series(namespace).frame()
+        self._registry_cache[namespace] = (key, frm)
+        return frm
+
     def create_collection(
         self, schema, *labels, raise_if_exists=True, namespace="collection"
     ):
@@ -3,10 +3,11 @@ from pathlib import PurePosixPath
 
 import boto3
 import urllib3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .pod import POD
-from .utils import logger
+from .utils import logger, settings
 
 
 def silence_insecure_warning():
@@ -51,8 +52,16 @@ class S3POD(POD):
                 aws_session_token=token,
                 profile_name=profile,
             )
+            # Allow one connection per pool thread, so concurrent
+            # transfers (see Collection.pull) are not throttled by
+            # urllib3
+            config = Config(max_pool_connections=max(settings.max_threads, 10))
             self.client = session.client(
-                "s3", verify=verify, aws_session_token=token, endpoint_url=endpoint_url
+                "s3",
+                verify=verify,
+                aws_session_token=token,
+                endpoint_url=endpoint_url,
+                config=config,
             )
         super().__init__()
 
@@ -129,9 +138,10 @@ class S3POD(POD):
     def isfile(self, relpath):
         key = str(self.path / relpath)
         try:
-            _ = self.client.get_object(Bucket=str(self.bucket), Key=key)
+            # Only fetch metadata, the payload is not needed
+            _ = self.client.head_object(Bucket=str(self.bucket), Key=key)
         except ClientError as err:
-            if err.response["Error"]["Code"] == "NoSuchKey":
+            if err.response["Error"]["Code"] in ("404", "NoSuchKey"):
                 return False
             # Other kind of error, reraise
             raise
@@ -1,6 +1,7 @@
 import shlex
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 
 from numcodecs import registry
 from numpy import (asarray, ascontiguousarray, dtype, frombuffer, issubdtype,
@@ -52,46 +53,49 @@ class Codec:
             if dt in (dtype("O"), dtype("U")):
                 default_codec_names = ["msgpack2", "zstd"]
             self.codec_names = default_codec_names
+        # Instantiate codecs once, encode and decode are on the hot path
+        self.codecs = [self.build_codec(name) for name in self.codec_names]
+
+    @staticmethod
+    def build_codec(codec_name):
+        codec = registry.codec_registry[codec_name]
+        if codec_name == "blosc":
+            return codec(cname="zstd", shuffle=codec.BITSHUFFLE)
+        return codec()
 
     def encode(self, arr, with_digest=False):
+        # encoding and digest both require contiguous memory
+        arr = ascontiguousarray(arr)
         if len(arr) == 0:
             res = b""
         else:
-            # encoding may require contiguous memory
-            res = ascontiguousarray(arr)
-            # convert to proper type
-            res = res.astype(self.dt)
+            # convert to proper type (no copy if already the case)
+            res = arr.astype(self.dt, copy=False)
             # Apply codecs
-            for codec_name in self.codec_names:
-                codec = registry.codec_registry[codec_name]
-                kw = {}
-                if codec_name == "blosc":
-                    kw = {
-                        "cname": "zstd",
-                        "shuffle": codec.BITSHUFFLE,
-                    }
-                res = codec(**kw).encode(res)
+            for codec in self.codecs:
+                res = codec.encode(res)
         if not with_digest:
             return res
 
-        # Extra step: compute digest
+        # Extra step: compute digest, the raw buffer is hashed in one
+        # pass
         if issubdtype(self.dt, "M"):
-            digest = hexdigest(ascontiguousarray(arr.view("i8")))
+            digest = hexdigest(arr.view("i8"))
         elif self.dt in (dtype("O"), dtype("U")):
             digest = hexdigest(res)
         else:
-            digest = hexdigest(ascontiguousarray(arr))
+            digest = hexdigest(arr)
         return res, digest
 
     def decode(self, arr):
         if len(arr) == 0:
             return asarray([], dtype=self.dt)
         # Apply all codecs
-        for name in reversed(self.codec_names):
-            codec = registry.codec_registry[name]
-            arr = codec().decode(arr)
+        for codec in reversed(self.codecs):
+            arr = codec.decode(arr)
         if self.dt in ("O", "U"):
-            return arr.astype(self.dt)
+            # msgpack already gives an object array, no need to copy it
+            return arr.astype(self.dt, copy=False)
         return frombuffer(arr, dtype=self.dt)
 
     def __eq__(self, other):
@@ -102,30 +106,43 @@ class Codec:
         return f"<Codec {self.dt}:{names}>"
 
 
+@lru_cache(maxsize=1024)
+def parse_definition(definition):
+    """
+    Parse a column definition like "timestamp*" or "float | zstd"
+    and return a `(dtype, idx, codec_names)` tuple
+    """
+    parser = shlex.shlex(definition, posix=True, punctuation_chars="|*")
+    parser.wordchars += "[]"
+    dt, *tokens = parser
+    idx = False
+    codec_names = []
+    state = None
+    for tk in tokens:
+        if tk == "|":
+            state = "codec"
+        elif tk == "*":
+            idx = True
+        elif state == "codec":
+            codec_names.append(tk)
+        else:
+            raise ValueError(f"Unexpected item: {tk}")
+    return dt, idx, tuple(codec_names)
+
+
 class SchemaColumn:
     def __init__(self, name, dt, codecs, idx):
         self.name = name
         self.codec = Codec(dt, *codecs)
         self.idx = idx
+        # Numpy scalar constructor (used by cast_scalar)
+        self.scalar_type = self.codec.dt.type
 
     @classmethod
     def from_ui(cls, name, definition):
-        parser = shlex.shlex(definition, posix=True, punctuation_chars="|*")
-        parser.wordchars += "[]"
-        dt, *tokens = parser
-        idx = False
-        codec_names = []
-        state = None
-        for tk in tokens:
-            if tk == "|":
-                state = "codec"
-            elif tk == "*":
-                idx = True
-            elif state == "codec":
-                codec_names.append(tk)
-            else:
-                raise ValueError(f"Unexpected item: {tk}")
-        return SchemaColumn(name, dt, codecs=codec_names, idx=idx)
+        # Column definitions are parsed once (shlex is slow)
+        dt, idx, codec_names = parse_definition(definition)
+        return SchemaColumn(name, dt, codecs=list(codec_names), idx=idx)
 
     def cast(self, arr):
         if isinstance(arr, ndarray) and issubdtype(arr.dtype, self.codec.dt):
@@ -147,7 +164,7 @@ class SchemaColumn:
         return arr
 
     def cast_scalar(self, value):
-        return dtype(self.codec.dt).type(value)
+        return self.scalar_type(value)
 
     def dumps(self):
         return {
@@ -176,6 +193,8 @@ class Schema:
                 definition = SchemaColumn.from_ui(name, definition)
             self.columns[name] = definition
 
+        # Ordered tuple of columns, used in loops
+        self._columns = tuple(self.columns.values())
         self.idx = {n: c for n, c in self.columns.items() if c.idx}
         self.non_idx = {n: c for n, c in self.columns.items() if not c.idx}
         if len(self.idx) == 0:
@@ -210,17 +229,14 @@ class Schema:
         if not isinstance(values, (list, tuple)):
             values = (values,)
         # TODO implement column type based repr
-        return tuple(str(val) for col, val in zip(self.columns.values(), values))
+        return tuple(str(val) for col, val in zip(self._columns, values))
 
     def deserialize(self, values=tuple()):
         if not values:
             return tuple()
         if not isinstance(values, (list, tuple)):
             values = (values,)
-        res = tuple(
-            col.cast_scalar(val) for col, val in zip(self.columns.values(), values)
-        )
-        return res
+        return tuple(col.cast_scalar(val) for col, val in zip(self._columns, values))
 
     @classmethod
     def loads(self, data):
@@ -232,7 +248,7 @@ class Schema:
         return Schema(**columns)
 
     def dumps(self):
-        columns = {c.name: c.dumps() for c in self.columns.values()}
+        columns = {c.name: c.dumps() for c in self._columns}
         return {"kind": self.kind, "columns": columns}
 
     def __iter__(self):
@@ -240,13 +256,13 @@ class Schema:
         return iter(self.columns.keys())
 
     def __repr__(self):
-        cols = [f"{c.name} {c.codec.dt}" for c in self.columns.values()]
+        cols = [f"{c.name} {c.codec.dt}" for c in self._columns]
         return "<Schema {}>".format(" ".join(cols))
 
     def __eq__(self, other):
-        return all(
-            x == y for x, y in zip(self.columns.values(), other.columns.values())
-        )
+        if len(self._columns) != len(other._columns):
+            return False
+        return all(x == y for x, y in zip(self._columns, other._columns))
 
     def cast(self, df=None):
         if df is None:
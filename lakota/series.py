@@ -40,9 +40,10 @@ class Series:
         before=None,
         closed="LEFT",
         from_ci=None,
+        reverse=False,
     ):
         """
-        Find matching segments
+        Find matching segments (last one first if `reverse` is set)
         """
 
         if not from_ci:
@@ -51,7 +52,9 @@ class Series:
             if not leaf_rev:
                 return []
             from_ci = leaf_rev.commit(self.collection)
-        return from_ci.segments(self.label, self.pod, start, stop, closed=closed)
+        return from_ci.segments(
+            self.label, self.pod, start, stop, closed=closed, reverse=reverse
+        )
 
     def period(self, rev):
         """
@@ -93,22 +96,26 @@ class Series:
         # XXX forbid repeated values in index ??
         assert frame.is_sorted(), "Frame is not sorted!"
 
-        # Save segments
-        all_dig = []
+        # Encode and save columns (codecs and hash functions release
+        # the GIL). Each payload is written as soon as it is encoded, so
+        # we never hold all the encoded columns in memory
         arr_length = None
-        embedded = {}
         with Pool() as pool:
             for name in self.schema:
-                # Cast array & check len
+                # Check len
                 values = frame[name]
                 if arr_length is None:
                     arr_length = len(values)
                 elif len(values) != arr_length:
                     raise ValueError("Length mismatch")
-                digest, embed_data = self._write_col(name, values, pool)
-                all_dig.append(digest)
-                if embed_data is not None:
-                    embedded[digest] = embed_data
+                pool.submit(self._save_col, name, values)
+
+        all_dig = []
+        embedded = {}
+        for digest, data in pool.results:
+            all_dig.append(digest)
+            if data is not None:
+                embedded[digest] = data
 
         # Build commit info
         start = frame.start() if start is None else start
@@ -137,24 +144,23 @@ class Series:
             embedded=embedded,
         )
 
-    def _write_col(self, name, values, pool):
+    def _save_col(self, name, values):
+        """
+        Encode and save column, returns its digest and its payload
+        if it must be embedded in the commit (None otherwise)
+        """
         # Encode content
         arr = self.schema[name].cast(values)
         # Create digest (based on actual array for simple
         # type, based on encoded content for O and U)
         codec = self.schema[name].codec
         data, digest = codec.encode(arr, with_digest=True)
-
-        embedded_data = None
-        if len(data) < settings.embed_max_size:  # every small array gets embedded
-            # Put small arrays aside
-            embedded_data = data
-        else:
-            folder, filename = hashed_path(digest)
-            # XXX move writing in Series.commit and handle situation where the commit gets to large?
-            # XXX keep it here for when a batch gets too large ?
-            pool.submit(self.pod.cd(folder).write, filename, data)
-        return digest, embedded_data
+        if len(data) < settings.embed_max_size:
+            # every small array gets embedded
+            return digest, data
+        folder, filename = hashed_path(digest)
+        self.pod.write(folder / filename, data)
+        return digest, None
 
     def update(self, frame):
         frame = Frame(self.schema, frame)
@@ -280,12 +286,13 @@ class Series:
             stop=self.schema.deserialize(stop),
             before=before,
             closed=closed,
+            reverse=True,
         )
 
         cnt = 0
         res = []
         # Create one frame per segment, starting from the last one.
-        for segment in reversed(list(segments)):
+        for segment in segments:
             frm = Frame.from_segments(
                 self.schema, [segment], select=select
             )
@@ -394,56 +401,41 @@ class Paginate:
                 yield frm
 
     def loop(self):
-        if self.select:
-            select_with_idx = self.select + [
-                c for c in self.series.schema.idx
-                if c not in self.select
-            ]
-        else:
-            select_with_idx = self.select
-
-        while True:
-            if self.limit == 0:
-                break
-            if self.limit is None:
-                lmt = self.step
-            else:
-                lmt = min(self.step, self.limit)
-
-            # Load some segments
-            read_len = 0
-            segments = []
-            for sgm in self.series.segments(self.start, self.stop, closed=self.closed):
-                segments.append(sgm)
-                read_len += len(sgm)
-                if read_len >= lmt:
-                    break
-
-            # Create frame & yield it
-            frm = Frame.from_segments(
-                self.series.schema, segments, limit=lmt, offset=self.offset,
-                select=select_with_idx,
-            )
-            yield frm.select(self.select)
-
-            # Update limit & offset
-            self.offset = max(self.offset - read_len, 0)
-            if self.offset == 0:
-                if self.limit is not None:
-                    self.limit = max(self.limit - len(frm), 0)
-
-            # Update start & closed
-            new_start = None
-            if not frm.empty:
-                new_start = frm.stop()
-            elif segments:
-                new_start = segments[-1].stop
-
-            if new_start is None or new_start == self.start:
-                # Start did not move, we must stop
-                break
-            self.start = new_start
-            self.closed = self.closed.set_left(False)
+        schema = self.series.schema
+        names = [n for n in schema if not self.select or n in self.select]
+        # Segments are consumed in one pass, a segment spanning several
+        # pages is read and decoded only once
+        segments = self.from_ci.segments(
+            self.series.label,
+            self.series.pod,
+            self.start,
+            self.stop,
+            closed=self.closed,
+        )
+        offset, limit = self.offset, self.limit
+        page, page_len = [], 0
+        empty = True
+        for sgm in segments:
+            sgm_len = len(sgm)
+            pos = min(offset, sgm_len)
+            offset -= pos
+            while pos < sgm_len and limit != 0:
+                size = self.step if limit is None else min(self.step, limit)
+                take = min(size - page_len, sgm_len - pos)
+                page.append((sgm, pos, pos + take))
+                page_len += take
+                pos += take
+                if page_len == size:
+                    yield Frame.from_slices(schema, page, names)
+                    empty = False
+                    if limit is not None:
+                        limit -= page_len
+                    page, page_len = [], 0
+            if limit == 0:
+                return
+        if page or empty:
+            # Last page, or an empty frame if nothing was found
+            yield Frame.from_slices(schema, page, names)
 
 
 class KVSeries(Series):
@@ -47,7 +47,7 @@ max_new_cases-> [22210]
 
 import operator
 import shlex
-from functools import reduce
+from functools import lru_cache, reduce
 
 import numpy
 from numpy import bincount, inf, max, maximum, mean, min, minimum, quantile, repeat, sum
@@ -242,19 +242,36 @@ def tokenize(expr):
 
 
 def scan(tokens, end_tk=")"):
-    res = []
+    # Use an explicit stack of nested lists instead of recursion, so
+    # that deeply nested expressions can not hit the recursion limit
+    stack = [[]]
     for tk in tokens:
         if tk.value == end_tk:
-            return res
+            if len(stack) == 1:
+                return stack[0]
+            res = stack.pop()
+            stack[-1].append(res)
         elif tk.value == "(":
-            res.append(scan(tokens))
+            stack.append([])
         else:
-            res.append(tk)
+            stack[-1].append(tk)
 
     tail = next(tokens, None)
     if tail:
         raise ValueError(f'Unexpected token: "{tail.value}"')
-    return res
+    # Close unbalanced lists
+    while len(stack) > 1:
+        res = stack.pop()
+        stack[-1].append(res)
+    return stack[0]
+
+
+@lru_cache(maxsize=1024)
+def parse_tokens(expr):
+    # Token trees are never mutated, so they can be shared between
+    # AST instances
+    res = tokenize(expr)
+    return scan(res)[0]
 
 
 class AST:
@@ -300,17 +317,37 @@ class AST:
 
     @classmethod
     def parse(cls, expr):
-        res = tokenize(expr)
-        tokens = scan(res)[0]
-        return AST(tokens)
+        return AST(parse_tokens(expr))
 
     def eval(self, env=None):
         env = Env(env or {})
         if isinstance(self.tokens, Token):
             return self.tokens.eval(env)
-        head, tail = self.tokens[0], self.tokens[1:]
-        args = [AST(tk).eval(env) for tk in tail]
 
+        # Walk the tree with an explicit stack of `(tokens, args)`
+        # pairs, `args` collects the evaluated arguments of the
+        # expression (no recursion nor list slicing)
+        stack = [(self.tokens, [])]
+        while True:
+            tokens, args = stack[-1]
+            pos = len(args) + 1
+            if pos < len(tokens):
+                tk = tokens[pos]
+                if isinstance(tk, Token):
+                    args.append(tk.eval(env))
+                else:
+                    stack.append((tk, []))
+                continue
+
+            # All arguments are known, apply head
+            stack.pop()
+            res = self.apply(tokens[0].eval(env), args)
+            if not stack:
+                return res
+            stack[-1][1].append(res)
+
+    @staticmethod
+    def apply(fn, args):
         # Split normal and kw args
         simple_args = []
         kw_args = {}
@@ -319,8 +356,6 @@ class AST:
                 kw_args.update(a.value)
             else:
                 simple_args.append(a)
-
-        fn = head.eval(env)
         return fn(*simple_args, **kw_args)
 
     def is_aggregate(self):
@@ -3,10 +3,10 @@ import logging
 import sys
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Flag
+from functools import lru_cache
 from hashlib import sha1
 from itertools import islice
 from pathlib import PurePosixPath
@@ -65,9 +65,25 @@ def chunky(collection, size=100):
 
 
 def hexdigest(*data):
+    """
+    Hex digest of the concatenation of `data`. Items can be any
+    object supporting the buffer protocol (like contiguous numpy
+    arrays). Small items are joined and hashed in one call, large
+    ones are hashed without being copied.
+
+    `default_hash` is part of the storage format: digests are used
+    as file names and revision checksums, so changing it would make
+    existing repositories unreadable.
+    """
+    if len(data) > 1 and sum(memoryview(d).nbytes for d in data) <= 2 ** 16:
+        data = (b"".join(data),)
+    if len(data) == 1:
+        # Common case, hash in one call
+        return default_hash(data[0]).hexdigest()
     digest = default_hash()
+    update = digest.update
     for datum in data:
-        digest.update(datum)
+        update(datum)
     return digest.hexdigest()
 
 
@@ -81,10 +97,9 @@ def hextime(timestamp=None):
     >>>
     """
     timestamp = time() if timestamp is None else timestamp
-    hex_ts = hex(
-        int(timestamp * 1000)
-    )  # get rid of sub-milisecond digits & convert fo hex
-    return hex_ts[2:].rjust(11, "0")  # remove the "0x" prefix and add zeroes on front
+    # Get rid of sub-milisecond digits, convert to hex and pad with
+    # zeroes in one go
+    return format(int(timestamp * 1000), "011x")
 
 
 def encoder(*items):
@@ -96,6 +111,8 @@ def encoder(*items):
 def strpt(time_str):
     if isinstance(time_str, datetime):
         return time_str
+    if isinstance(time_str, date):
+        return datetime(time_str.year, time_str.month, time_str.day)
     if not time_str:
         return None
     return datetime.fromisoformat(time_str)
@@ -119,53 +136,83 @@ def paginate(start, stop, **delta_kw):
         step = next_step
 
 
+def bisect_columns(columns, values, right=False, lo=0):
+    """
+    Binary search of `values` over `columns`, a list of arrays sorted
+    lexicographically (one array per value). The search window is
+    narrowed column after column, starting from position `lo`.
+    """
+    last = min(len(columns), len(values)) - 1
+    if last < 0:
+        return lo
+    hi = None  # End of the arrays
+    for arr, val in zip(columns[:last], values[:last]):
+        # Narrow the search window (slicing returns a view)
+        arr = arr[lo:hi]
+        start = int(arr.searchsorted(val, side="left"))
+        stop = int(arr.searchsorted(val, side="right"))
+        if start == stop:
+            # Empty window, both sides are equal
+            return lo + start
+        lo, hi = lo + start, lo + stop
+    # Only one side of the window is needed on last column
+    arr = columns[last][lo:hi]
+    side = "right" if right else "left"
+    return lo + int(arr.searchsorted(values[last], side=side))
+
+
+@lru_cache(maxsize=2 ** 16)
 def hashed_path(digest, depth=2):
     """
     Pair-wise hashing of the `digest` string, example:
     12345678 -> (Path(12/34), "5678") (with depth = 2)
     """
     assert len(digest) > 2 * depth
-    folder = PurePosixPath(".")
-    for _ in range(depth):
-        prefix, digest = digest[:2], digest[2:]
-        folder = folder / prefix
+    # Build the folder in one go instead of chaining "/" operations
+    prefixes = (digest[pos : pos + 2] for pos in range(0, 2 * depth, 2))
+    return PurePosixPath(*prefixes), digest[2 * depth :]
 
-    return folder, digest
+
+_PRETTY_PREFIXES = "yzafpnum_kMGTPEZY"
+_PRETTY_FACTORS = tuple(1000 ** i for i in range(-8, 8))
 
 
 def pretty_nb(number):
-    prefixes = "yzafpnum_kMGTPEZY"
-    factors = [1000 ** i for i in range(-8, 8)]
     if number == 0:
         return 0
     if number < 0:
         return "-" + pretty_nb(-number)
-    idx = bisect.bisect_right(factors, number) - 1
-    prefix = prefixes[idx]
-    return "%.2f%s" % (number / factors[idx], "" if prefix == "_" else prefix)
+    idx = bisect.bisect_right(_PRETTY_FACTORS, number) - 1
+    prefix = _PRETTY_PREFIXES[idx]
+    return "%.2f%s" % (number / _PRETTY_FACTORS[idx], "" if prefix == "_" else prefix)
 
 
-@contextmanager
-def timeit(title=""):
-    start = perf_counter()
-    yield
-    delta = perf_counter() - start
-    print(title, pretty_nb(delta) + "s", file=sys.stderr)
+class timeit:
+    """
+    Context manager that prints the time spent in its block (plain
+    class, no generator machinery)
+    """
 
+    __slots__ = ("title", "start")
 
-def memoize(fn):
-    fn = fn
-    cache = {}
+    def __init__(self, title=""):
+        self.title = title
 
-    def wrapper(*a, **kw):
-        key = a + tuple(kw.keys()) + tuple(kw.values())
-        if key in cache:
-            return cache[key]
-        res = fn(*a, **kw)
-        cache[key] = res
-        return res
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
 
-    return wrapper
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is not None:
+            # Only report blocks that ran to completion
+            return
+        delta = perf_counter() - self.start
+        print(self.title, pretty_nb(delta) + "s", file=sys.stderr)
+
+
+def memoize(fn):
+    # lru_cache probes its cache in C and is thread-safe
+    return lru_cache(maxsize=None)(fn)
 
 
 class Pool:
@@ -198,10 +245,12 @@ class Pool:
             self.results.append(fn(*a, **kw))
 
     def __exit__(self, type, value, traceback):
-        if self.threaded:
+        if not self.threaded:
+            return
+        try:
             self.results = [fut.result() for fut in self.futures]
-        # Release lock
-        if self.threaded:
+        finally:
+            # Release lock, even if a task failed
             Pool._lock.release()
             self.threaded = False
 
@@ -108,3 +108,21 @@ def test_leafs():
 
     # Last writes wins
     assert changelog.leaf().read() == b"bar"
+
+
+def test_log_cache(pod):
+    changelog = Changelog(pod)
+    populate(changelog, datum)
+    revs = changelog.log()
+
+    # Refresh without any change on the pod gives back the same revisions
+    changelog.refresh()
+    assert changelog.log() == revs
+    assert all(a is b for a, b in zip(changelog.log(), revs))
+
+    # New revisions are picked up, even if written by another changelog
+    Changelog(pod).commit(b"new")
+    changelog.refresh()
+    new_revs = changelog.log()
+    assert len(new_revs) == len(revs) + 1
+    assert new_revs[-1].read() == b"new"
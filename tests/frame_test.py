@@ -54,6 +54,32 @@ def test_index_slice():
     assert all(res == [6])
 
 
+def test_index_single_value():
+    # A lookup on a single value must match the multi-column search
+    # and a plain searchsorted, for values in and out of the frame
+    schema = Schema(x="int*", y="int*")
+    frm = Frame(schema, {"x": [1, 2, 2, 4, 5, 5, 5, 6], "y": [0, 1, 2, 3, 4, 5, 6, 7]})
+    xs = frm["x"]
+    for val in range(0, 8):
+        for right in (False, True):
+            side = "right" if right else "left"
+            expected = xs.searchsorted(val, side=side)
+            assert frm.index([val], right=right) == expected
+            # Second value beyond the range of "y" on the searched side
+            assert frm.index([val, 99 if right else -1], right=right) == expected
+            for lo in (0, 3, 6):
+                assert frm.index([val], right=right, lo=lo) == max(lo, expected)
+
+
+def test_eq_nan():
+    schema = Schema(x="int*", y="float")
+    frm = Frame(schema, {"x": [1, 2], "y": [1.0, 2.0]})
+    assert frm == frm
+    # NaN is not equal to itself, even within the same array
+    frm = Frame(schema, {"x": [1, 2], "y": [1.0, float("nan")]})
+    assert not frm == frm
+
+
 def test_getitem():
     # with a slice
     schema = Schema(x="int*")
@@ -180,6 +206,11 @@ def test_concat(frm):
     assert Frame.concat(frm) == frm
     assert Frame.concat() is None
 
+    # Empty frames are ignored
+    empty = frm.slice(0, 0)
+    assert Frame.concat(empty, frm, empty) == frm
+    assert Frame.concat(empty, empty).empty
+
 
 def test_eq(frm):
     assert (frm == frm) is True
@@ -215,6 +246,8 @@ def test_sort():
     assert all(frm["category"] == sorted(category))
     assert all(frm["value"] == sorted(value))
     assert frm.is_sorted() == True
+    # Sorting again is a no-op
+    assert frm.sorted() == frm
 
     # multi-index
     timestamp = ["2020-01-02", "2020-01-03", "2020-01-02"]
@@ -235,6 +268,19 @@ def test_sort():
     assert all(frm["value"] == [2, 3, 1])
     assert frm.is_sorted() == True
 
+    # multi-index, second column only matters on ties
+    frm = Frame(
+        multi_idx_schema,
+        {
+            "timestamp": ["2020-01-01", "2020-01-02", "2020-01-02"],
+            "category": ["z", "a", "b"],
+            "value": [1, 2, 3],
+        },
+    )
+    assert frm.is_sorted() == True
+    frm["category"] = ["z", "b", "a"]
+    assert frm.is_sorted() == False
+
     # Sort on custom columns
     category = ["a", "c", "a"]
     value = [3, 2, 1]
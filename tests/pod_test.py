@@ -1,4 +1,5 @@
 import pytest
+from numpy import asarray
 
 from lakota.pod import S3POD, CachePOD, FilePOD, MemPOD, POD
 
@@ -119,6 +120,14 @@ def test_write_rm_many(pod):
     assert res == ["key"]
 
 
+def test_file_write_array(tmp_path):
+    # Codecs may return arrays instead of bytes
+    arr = asarray([1.5, 2.5, 3.5])
+    pod = FilePOD(tmp_path)
+    assert pod.write("key", arr) == arr.nbytes
+    assert pod.read("key") == arr.tobytes()
+
+
 def test_mv(pod):
     assert pod.ls(missing_ok=True) == []
     pod.write("key", deadbeef)
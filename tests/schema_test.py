@@ -23,6 +23,19 @@ def test_simple_codec():
     assert all(arr == arr2)
 
 
+def test_codec_digest_strided():
+    # Digest must not depend on the memory layout of the input
+    arr = asarray(range(100), dtype="i8")
+    for dt in ("i8", "M8[s]", "str"):
+        codec = Codec(dt)
+        strided = arr.astype(codec.dt)[::2]
+        contiguous = strided.copy()
+        assert not strided.flags.c_contiguous
+        assert codec.encode(strided, with_digest=True) == codec.encode(
+            contiguous, with_digest=True
+        )
+
+
 def test_vlen_codecs():
     for codecs in ("", "vlen-utf8", "vlen-utf8 gzip"):
         schema = Schema(val=f"str*  |{codecs}")
@@ -68,3 +81,5 @@ def test_serialize():
 def test_equality():
     definition = {"timestamp": "timestamp*", "float": "f8", "int": "i8", "str": "str"}
     assert Schema(**definition) == Schema(**definition)
+    # A schema is not equal to one of its prefixes
+    assert Schema(**definition) != Schema(timestamp="timestamp*", float="f8")
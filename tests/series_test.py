@@ -3,11 +3,14 @@ from random import shuffle
 from time import sleep
 
 import pytest
+from numcodecs import registry
 from numpy import asarray
 from pandas import DataFrame
 
 from lakota import Frame, Repo, Schema
 from lakota.schema import ALIASES
+from lakota.series import Paginate
+from lakota.utils import Pool
 
 # Default schema with some data
 schema = Schema(timestamp="int *", value="float")
@@ -431,6 +434,46 @@ def test_rev_filter(series):
     assert old_frm == orig_frm
 
 
+def test_leaf_commit_cache(series):
+    leaf = series.changelog.leaf()
+    ci = leaf.commit(series.collection)
+    embedded = dict(ci.embedded)
+    assert leaf.commit(series.collection) is ci
+
+    series.write({"timestamp": [1589455906], "value": [6.6]})
+    # Cached commit is not mutated by the write built on it
+    assert ci.embedded == embedded
+    # Previous leaf does not hold its decoded commit anymore
+    (old,) = [rev for rev in series.changelog.log() if rev.path == leaf.path]
+    assert not old.is_leaf
+    assert old._commit is None
+
+
+def test_failed_write(repo, threaded):
+    schema = Schema(timestamp="int *", value="O")
+    series = repo.create_collection(schema, "obj") / "_"
+    frm = {"timestamp": [1, 2], "value": [{1, 2}, object()]}
+    with pytest.raises(TypeError):
+        series.write(frm)
+    # A failed encoding must not leave the pool locked
+    assert not Pool._lock.locked()
+    series.write({"timestamp": [1, 2], "value": [{"a": 1}, "b"]})
+    assert len(series.frame()) == 2
+
+
+def test_commit_payload(series):
+    rev = series.changelog.leaf()
+    payload = rev.read()
+    ci = rev.commit(series.collection)
+    # Payload format is unchanged
+    assert ci.encode() == payload
+    codec = registry.codec_registry["msgpack2"]()
+    assert codec.encode(codec.decode(payload)) == payload
+    # Decoded digests are encoded the same way
+    ci.digest
+    assert ci.encode() == payload
+
+
 @pytest.mark.parametrize("extra_commit", [True, False])
 @pytest.mark.parametrize("select_col", ["timestamp", "value"])
 def test_paginate(repo, extra_commit, select_col):
@@ -515,6 +558,11 @@ def test_paginate(repo, extra_commit, select_col):
     series = clct / "zero"
     frames = list(series.paginate(select=[select_col]))
     assert len(frames) == 0
+    # Paginate.loop yields one empty frame (filtered by iter)
+    frames = list(Paginate(series, select=[select_col]).loop())
+    assert len(frames) == 1
+    assert frames[0].empty
+    assert frames[0].keys() == [select_col]
 
     # Test series with one line
     series = clct / "one"
@@ -746,3 +794,18 @@ def test_bool(series):
 #         series.write(frm)
 #         itv = series.interval()
 #         assert itv == partition
+
+
+def test_point_query(series):
+    # Add some extra segments
+    for ts in range(1589455906, 1589455910):
+        series.write({"timestamp": [ts], "value": [float(ts % 10)]})
+
+    frm = series.frame()
+    for ts, value in zip(frm["timestamp"], frm["value"]):
+        # Only one segment must be selected
+        segments = list(series.segments(start=(ts,), stop=(ts,), closed="BOTH"))
+        assert len(segments) == 1
+        res = series.frame(start=ts, stop=ts, closed="BOTH")
+        assert list(res["timestamp"]) == [ts]
+        assert list(res["value"]) == [value]
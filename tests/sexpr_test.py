@@ -123,6 +123,14 @@ def test_pathologic_inputs():
             AST.parse(expr).eval()
 
 
+def test_deep_nesting():
+    # Parsing and evaluation do not recurse, deep expressions do not
+    # hit the recursion limit
+    depth = 5000
+    expr = "(+ 1 " * depth + "0" + ")" * depth
+    assert AST.parse(expr).eval() == depth
+
+
 def test_alias():
     res = AST.parse("(as (asarray (list 1 2 3)) 'new_name')").eval()
     arr = res.value
@@ -1,10 +1,24 @@
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 from itertools import chain
+from pathlib import PurePosixPath
 
 import pytest
+from numpy import asarray
 from pandas import date_range
 
-from lakota.utils import Closed, Pool, as_tz, chunky, drange, strpt, timeit
+from lakota.utils import (
+    Closed,
+    Pool,
+    as_tz,
+    bisect_columns,
+    chunky,
+    drange,
+    hashed_path,
+    hexdigest,
+    memoize,
+    strpt,
+    timeit,
+)
 
 
 def my_fun(i, flaky=False):
@@ -26,6 +40,8 @@ def test_pool(threaded):
         with Pool() as pool:
             for i in range(3):
                 pool.submit(my_fun, i, flaky=True)
+    # Lock is released after a failure
+    assert not Pool._lock.locked()
 
 
 def test_chunk():
@@ -36,6 +52,75 @@ def test_chunk():
         assert res == expected
 
 
+def test_hexdigest():
+    # Small and large chunks must give the same digest as one buffer
+    for size in (10, 100_000):
+        payload = bytes(range(256)) * size
+        parts = [payload[i : i + 1000] for i in range(0, len(payload), 1000)]
+        assert hexdigest(*parts) == hexdigest(payload)
+
+
+def test_bisect_columns():
+    first = asarray([1, 1, 2, 2, 3])
+    second = asarray([1, 2, 1, 3, 1])
+    columns = [first, second]
+    assert bisect_columns(columns, (2,)) == 2
+    assert bisect_columns(columns, (2,), right=True) == 4
+    assert bisect_columns(columns, (2, 3)) == 3
+    assert bisect_columns(columns, (2, 3), right=True) == 4
+    # Missing values
+    assert bisect_columns(columns, (2, 2)) == 3
+    assert bisect_columns(columns, (0, 5), right=True) == 0
+    assert bisect_columns(columns, (4,)) == 5
+    # Search starting at lo
+    assert bisect_columns(columns, (1,), lo=3) == 3
+
+
+def test_hashed_path():
+    assert hashed_path("12345678") == (PurePosixPath("12/34"), "5678")
+    assert hashed_path("12345678", depth=3) == (PurePosixPath("12/34/56"), "78")
+
+    # Results are memoized
+    hits = hashed_path.cache_info().hits
+    hashed_path("12345678")
+    assert hashed_path.cache_info().hits == hits + 1
+
+
+def test_memoize():
+    calls = []
+
+    @memoize
+    def double(x, factor=2):
+        calls.append(x)
+        return x * factor
+
+    assert double(1) == double(1) == 2
+    assert double(1, factor=3) == 3
+    assert calls == [1, 1]
+
+
+def test_strpt():
+    expected = datetime(2020, 1, 2)
+    assert strpt("2020-01-02") == expected
+    assert strpt(date(2020, 1, 2)) == expected
+    assert strpt(expected) is expected
+    assert strpt("2020-01-02 03:04:05") == datetime(2020, 1, 2, 3, 4, 5)
+    assert strpt("") is None
+
+
+def test_timeit(capsys):
+    with timeit("block"):
+        pass
+    out = capsys.readouterr().err
+    assert out.startswith("block ") and out.strip().endswith("s")
+
+    # Nothing is printed when the block raises
+    with pytest.raises(ValueError):
+        with timeit("fail"):
+            raise ValueError()
+    assert capsys.readouterr().err == ""
+
+
 def test_drange():
     delta = timedelta(days=1)
     arr = drange("2020-01-01", "2020-01-10", delta)